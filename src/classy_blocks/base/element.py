@@ -2,8 +2,11 @@ import abc
 import copy
 from typing import Dict, List, Optional, TypeVar
 
+import numpy as np
+
 from classy_blocks.base import transforms as tr
 from classy_blocks.types import NPPointType, PointType, VectorType
+from classy_blocks.util.constants import DTYPE
 
 ElementBaseT = TypeVar("ElementBaseT", bound="ElementBase")
 
@@ -12,10 +15,21 @@ class ElementBase(abc.ABC):
     """Base class for mesh-building elements and tools
     for manipulation thereof."""
 
+    # empty slots allow subclasses to do without __dict__
+    __slots__ = ()
+
     def translate(self: ElementBaseT, displacement: VectorType) -> ElementBaseT:
         """Move by displacement vector; returns the same instance
         to enable chaining of transformations."""
-        for component in self.parts:
+        parts = self.parts
+        if not parts:
+            # nothing to transform (line and projected edges)
+            return self
+
+        # convert once instead of in every part
+        displacement = np.asarray(displacement, dtype=DTYPE)
+
+        for component in parts:
             component.translate(displacement)
 
         return self
@@ -23,10 +37,17 @@ class ElementBase(abc.ABC):
     def rotate(self: ElementBaseT, angle: float, axis: VectorType, origin: Optional[PointType] = None) -> ElementBaseT:
         """Rotate by 'angle' around 'axis' going through 'origin';
         returns the same instance to enable chaining of transformations."""
+        parts = self.parts
+        if not parts:
+            return self
+
         if origin is None:
             origin = self.center
 
-        for component in self.parts:
+        axis = np.asarray(axis, dtype=DTYPE)
+        origin = np.asarray(origin, dtype=DTYPE)
+
+        for component in parts:
             component.rotate(angle, axis, origin)
 
         return self
@@ -35,10 +56,16 @@ class ElementBase(abc.ABC):
         """Scale with respect to given origin; returns the same instance
         to enable chaining of transformations. If no origin is given,
         the entity is scaled with respect to its center"""
+        parts = self.parts
+        if not parts:
+            return self
+
         if origin is None:
             origin = self.center
 
-        for component in self.parts:
+        origin = np.asarray(origin, dtype=DTYPE)
+
+        for component in parts:
             component.scale(ratio, origin)
 
         return self
@@ -71,31 +98,23 @@ class ElementBase(abc.ABC):
     def transform(self: ElementBaseT, transforms: List[tr.Transformation]) -> ElementBaseT:
         """A function that transforms  to sketch_2;
         a Loft will be made from those"""
+        if not self.parts:
+            return self
 
         for t7m in transforms:
-            # remember center or it will change during transformation
-            # of each self.part
-            center = self.center
-
-            for part in self.parts:
-                if isinstance(t7m, tr.Translation):
-                    part.translate(t7m.displacement)
-                    continue
-
-                if isinstance(t7m, tr.Rotation):
-                    origin = t7m.origin
-                    if origin is None:
-                        origin = center
-
-                    part.rotate(t7m.angle, t7m.axis, origin=origin)
-                    continue
-
-                if isinstance(t7m, tr.Scaling):
-                    origin = t7m.origin
-                    if origin is None:
-                        origin = center
-
-                    part.scale(t7m.ratio, origin=origin)
-                    continue
+            if isinstance(t7m, tr.Translation):
+                self.translate(t7m.displacement)
+                continue
+
+            if isinstance(t7m, tr.Rotation):
+                # take the center before anything is transformed
+                origin = self.center if t7m.origin is None else t7m.origin
+                self.rotate(t7m.angle, t7m.axis, origin)
+                continue
+
+            if isinstance(t7m, tr.Scaling):
+                origin = self.center if t7m.origin is None else t7m.origin
+                self.scale(t7m.ratio, origin)
+                continue
 
         return self
@@ -1,10 +1,11 @@
 import abc
 import warnings
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, cast
 
 import numpy as np
 import scipy.optimize
 
+from classy_blocks.base import transforms as tr
 from classy_blocks.base.element import ElementBase
 from classy_blocks.construct.point import Point
 from classy_blocks.types import NPPointListType, NPPointType, ParamCurveFuncType, PointListType, PointType
@@ -70,7 +71,7 @@ class CurveBase(ElementBase):
         estimation can be supplied."""
         # because curves can have all sorts of shapes, find
         # initial guess by checking distance to discretized points
-        point = np.array(point)
+        point = np.asarray(point, dtype=DTYPE)
         all_points = self.discretize()
 
         distances = np.array([f.norm(p - point) for p in all_points])
@@ -86,7 +87,7 @@ class PointCurveBase(CurveBase):
     @staticmethod
     def _check_points(points: PointListType) -> List[Point]:
         """Check that provided points are sufficient for a curve"""
-        points = np.array(points, dtype=DTYPE)
+        points = np.asarray(points, dtype=DTYPE)
         shape = np.shape(points)
 
         if shape[0] < 2:
@@ -97,6 +98,72 @@ class PointCurveBase(CurveBase):
 
         return [Point(p) for p in points]
 
+    @property
+    def _positions(self) -> NPPointListType:
+        """Positions of all points as a single array"""
+        return np.array([point.position for point in cast(List[Point], self.parts)])
+
+    def _move_points(self, positions: NPPointListType) -> None:
+        """Moves all points to new positions at once
+        instead of transforming each point separately"""
+        for point, position in zip(cast(List[Point], self.parts), positions):
+            point.move_to(position)
+
+    def translate(self, displacement):
+        """Translates all points in a single go"""
+        self._move_points(self._positions + np.asarray(displacement, dtype=DTYPE))
+
+        return self
+
+    def rotate(self, angle, axis, origin=None):
+        """Rotates all points in a single go"""
+        if origin is None:
+            origin = self.center
+
+        self._move_points(f.rotate(self._positions, angle, axis, origin))
+
+        return self
+
+    def scale(self, ratio, origin=None):
+        """Scales all points in a single go"""
+        if origin is None:
+            origin = self.center
+
+        self._move_points(f.scale(self._positions, ratio, origin))
+
+        return self
+
+    def transform(self, transforms: List[tr.Transformation]):
+        """Composes all transforms into a single affine matrix
+        and moves points only once"""
+        matrix = np.eye(4)
+        # center is only calculated when a transform without origin is requested;
+        # it is transformed together with points as the curve changes
+        center = None
+
+        for t7m in transforms:
+            if isinstance(t7m, tr.Translation):
+                step = f.affine_translation(t7m.displacement)
+            elif isinstance(t7m, (tr.Rotation, tr.Scaling)):
+                origin = t7m.origin
+                if origin is None:
+                    if center is None:
+                        center = self.center
+                    origin = f.apply_affine(matrix, center)
+
+                if isinstance(t7m, tr.Rotation):
+                    step = f.affine_rotation(t7m.angle, t7m.axis, origin)
+                else:
+                    step = f.affine_scaling(t7m.ratio, origin)
+            else:
+                continue
+
+            matrix = np.dot(step, matrix)
+
+        self._move_points(f.apply_affine(matrix, self._positions))
+
+        return self
+
     @property
     def center(self):
         warnings.warn("Using an approximate default curve center (average)!", stacklevel=2)
@@ -122,7 +189,7 @@ class FunctionCurveBase(PointCurveBase):
         To improve search speed and reliability, an optional starting
         estimation can be supplied."""
         param_start = super().get_closest_param(point)
-        point = np.array(point)
+        point = np.asarray(point, dtype=DTYPE)
 
         result = scipy.optimize.minimize(
             lambda t: f.norm(self.get_point(t[0]) - point), (param_start,), bounds=(self.bounds,)
@@ -2,9 +2,11 @@ import warnings
 from typing import Optional
 
 import numpy as np
+from numpy.typing import NDArray
 
 from classy_blocks.construct.curves.curve import PointCurveBase
 from classy_blocks.types import NPPointListType, NPPointType, PointListType, PointType
+from classy_blocks.util.constants import DTYPE
 
 
 class DiscreteCurve(PointCurveBase):
@@ -18,7 +20,13 @@ class DiscreteCurve(PointCurveBase):
     Length just sums the distances between points."""
 
     def __init__(self, points: PointListType):
-        self.points = self._check_points(points)
+        # positions of points in a single array and distances from
+        # the first point along the curve; discarded on transformation
+        # and then calculated again on demand
+        self._point_array: Optional[NPPointListType] = np.array(points, dtype=DTYPE)
+        self._lengths: Optional[NDArray] = None
+
+        self.points = self._check_points(self._point_array)
         self.bounds = (0, len(self.points) - 1)
 
     def discretize(
@@ -31,7 +39,7 @@ class DiscreteCurve(PointCurveBase):
         param_start = int(min(param_from, param_to))
         param_end = int(max(param_from, param_to))
 
-        discretized = np.array([p.position for p in self.points[param_start : param_end + 1]])
+        discretized = self.point_array[param_start : param_end + 1].copy()
 
         if param_from > param_to:
             return np.flip(discretized, axis=0)
@@ -40,10 +48,29 @@ class DiscreteCurve(PointCurveBase):
 
     def get_length(self, param_from: Optional[float] = None, param_to: Optional[float] = None) -> float:
         """Returns the length of this curve between specified params."""
+        param_from, param_to = self._get_params(param_from, param_to)
+        lengths = self.lengths
+
+        return abs(lengths[int(param_to)] - lengths[int(param_from)])
+
+    @property
+    def point_array(self) -> NPPointListType:
+        """Positions of all points as a single contiguous array"""
+        if self._point_array is None:
+            self._point_array = np.array([point.position for point in self.points])
 
-        # TODO: use the same function as items.edges.spline
-        discretized = self.discretize(param_from, param_to)
-        return np.sum(np.sqrt(np.sum((discretized[:-1] - discretized[1:]) ** 2, axis=1)))
+        return self._point_array
+
+    @property
+    def lengths(self) -> NDArray:
+        """Cumulative lengths of segments, starting with 0 at the first point"""
+        if self._lengths is None:
+            segments = np.diff(self.point_array, axis=0)
+            segment_lengths = np.sqrt(np.einsum("ij,ij->i", segments, segments))
+
+            self._lengths = np.concatenate(([0], np.cumsum(segment_lengths)))
+
+        return self._lengths
 
     def get_closest_param(self, point: PointType) -> float:
         """Returns the index of point on this curve where distance to supplied
@@ -64,4 +91,9 @@ class DiscreteCurve(PointCurveBase):
 
     @property
     def parts(self):
+        # This is called when a transform of any kind is requested on
+        # this class; cached positions and lengths are no longer valid
+        self._point_array = None
+        self._lengths = None
+
         return self.points
@@ -1,6 +1,7 @@
 import warnings
 from typing import List
 
+from classy_blocks.base import transforms as tr
 from classy_blocks.base.element import ElementBase
 from classy_blocks.base.exceptions import EdgeCreationError
 from classy_blocks.construct.curves.curve import CurveBase
@@ -13,6 +14,8 @@ from classy_blocks.util import functions as f
 class EdgeData(ElementBase):
     """Common operations on classes for edge creation"""
 
+    __slots__ = ()
+
     kind: EdgeKindType
 
     @property
@@ -33,6 +36,8 @@ class EdgeData(ElementBase):
 class Line(EdgeData):
     """A 'line' edge is created by default and needs no extra parameters"""
 
+    __slots__ = ()
+
     kind = "line"
 
 
@@ -40,6 +45,8 @@ class Arc(EdgeData):
     """Parameters for an arc edge: classic OpenFOAM circular arc
     definition with a single point lying anywhere on the arc"""
 
+    __slots__ = ("point",)
+
     kind = "arc"
 
     def __init__(self, arc_point: PointType):
@@ -62,6 +69,8 @@ class Origin(EdgeData):
     If an edge was specified by 'angle' or 'origin', the definition will be output as a comment
     next to that edge definition."""
 
+    __slots__ = ("flatness", "origin")
+
     kind = "origin"
 
     def __init__(self, origin: PointType, flatness: float = 1):
@@ -84,6 +93,8 @@ class Angle(EdgeData):
     If an edge was specified by 'angle' or 'origin', the definition will be output as a comment
     next to that edge definition."""
 
+    __slots__ = ("angle", "axis")
+
     kind = "angle"
 
     def __init__(self, angle: float, axis: VectorType):
@@ -104,6 +115,8 @@ class Angle(EdgeData):
 class Project(EdgeData):
     """Parameters for a 'project' edge"""
 
+    __slots__ = ("label",)
+
     kind = "project"
 
     def __init__(self, label: ProjectToType):
@@ -140,6 +153,8 @@ class Project(EdgeData):
 class OnCurve(EdgeData):
     """An edge, snapped to a parametric curve"""
 
+    __slots__ = ("_repr", "curve", "n_points")
+
     kind: EdgeKindType = "curve"
 
     def __init__(self, curve: CurveBase, n_points: int = 10, representation: EdgeKindType = "spline"):
@@ -156,6 +171,11 @@ class OnCurve(EdgeData):
     def center(self):
         return self.curve.center
 
+    def transform(self, transforms: List[tr.Transformation]) -> "OnCurve":
+        # the curve composes all transforms itself
+        self.curve.transform(transforms)
+        return self
+
     @property
     def representation(self) -> EdgeKindType:
         return self._repr
@@ -167,20 +187,14 @@ class OnCurve(EdgeData):
 class Spline(OnCurve):
     """Parameters for a spline edge"""
 
+    __slots__ = ()
+
     kind: EdgeKindType = "spline"
 
     def __init__(self, points: PointListType):
         curve = DiscreteCurve(points)
         super().__init__(curve, n_points=len(points), representation=self.kind)
 
-    @property
-    def parts(self):
-        return [self.curve]
-
-    @property
-    def center(self):
-        return self.curve.center
-
     @property
     def representation(self) -> EdgeKindType:
         return self.kind
@@ -189,9 +203,7 @@ class Spline(OnCurve):
 class PolyLine(Spline):
     """Parameters for a polyLine edge"""
 
+    __slots__ = ()
+
     # a bug? (https://github.com/python/mypy/issues/8796)
     kind: EdgeKindType = "polyLine"
-
-    @property
-    def representation(self) -> EdgeKindType:
-        return self.kind
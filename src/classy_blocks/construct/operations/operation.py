@@ -217,7 +217,7 @@ class Operation(ElementBase):
         """Returns a new Face on specified side of the Operation.
         Warning: bottom, left and front faces must be inverted prior
         to using them for a loft/extrude etc."""
-        return Face([self.point_array[i] for i in constants.FACE_MAP[side]])
+        return Face(np.take(self.point_array, constants.FACE_MAP[side], axis=0))
 
     @property
     def patch_names(self) -> Dict[OrientType, str]:
@@ -10,11 +10,18 @@ from classy_blocks.util.constants import DTYPE, TOL, vector_format
 
 PointT = TypeVar("PointT", bound="Point")
 
+# the default origin of transformations, shared by all points;
+# read-only so that nobody can move it
+_ORIGIN = np.zeros(3, dtype=DTYPE)
+_ORIGIN.flags.writeable = False
+
 
 class Point(ElementBase):
     """A 3D point in space with optional projection
     to a set of surfaces and transformations"""
 
+    __slots__ = ("position", "projected_to")
+
     def __init__(self, position: PointType):
         self.position = np.array(position, dtype=DTYPE)
         if not np.shape(self.position) == (3,):
@@ -36,15 +43,16 @@ class Point(ElementBase):
     def rotate(self, angle, axis, origin: Optional[PointType] = None):
         """Rotate this point around an arbitrary axis and origin"""
         if origin is None:
-            origin = f.vector(0, 0, 0)
+            origin = _ORIGIN
 
-        self.position = f.rotate(self.position, angle, f.unit_vector(axis), origin)
+        # f.rotate() normalizes the axis itself
+        self.position = f.rotate(self.position, angle, axis, origin)
         return self
 
     def scale(self, ratio, origin: Optional[PointType] = None):
         """Scale point's position around origin."""
         if origin is None:
-            origin = f.vector(0, 0, 0)
+            origin = _ORIGIN
 
         self.position = f.scale(self.position, ratio, origin)
         return self
@@ -82,6 +90,8 @@ class Point(ElementBase):
 class Vector(Point):
     """An 'alias' to avoid confusion in mathematical lingo"""
 
+    __slots__ = ()
+
     @property
     def components(self) -> NPVectorType:
         """Vector's components (same as point's position but more
@@ -1,4 +1,4 @@
-from typing import List, get_args
+from typing import List, Tuple, get_args
 
 from classy_blocks.grading.chop import Chop
 from classy_blocks.items.axis import Axis
@@ -13,6 +13,8 @@ from classy_blocks.util.frame import Frame
 class Block:
     """A Block and everything that belongs to it"""
 
+    __slots__ = ("_wire_list", "axes", "cell_zone", "comment", "index", "vertices", "wires")
+
     def __init__(self, index: int, vertices: List[Vertex]):
         # index in blockMeshDict
         self.index = index
@@ -30,6 +32,8 @@ class Block:
                 self.wires.add_beam(pair[0], pair[1], wire)
 
         self.axes = [Axis(i, self.wires.get_axis_beams(i)) for i in get_args(AxisType)]
+        # wires never change after creation; keep a flat tuple of them at hand
+        self._wire_list = tuple(self.axes[0].wires + self.axes[1].wires + self.axes[2].wires)
 
         # cellZone to which the block belongs to
         self.cell_zone: str = ""
@@ -40,7 +44,9 @@ class Block:
 
     def add_edge(self, corner_1: int, corner_2: int, edge: Edge):
         """Adds an edge between vertices at specified indexes."""
-        if not (0 <= corner_1 < 8 and 0 <= corner_2 < 8):
+        # valid indexes 0...7 fit in the lowest 3 bits; anything else
+        # (including negative numbers) sets at least one of the higher ones
+        if (corner_1 | corner_2) & ~7:
             raise ValueError(
                 f"Invalid corner 1 ({corner_1}) or corner 2 ({corner_2}) index. Use block-local indexing (0...7)."
             )
@@ -100,9 +106,9 @@ class Block:
                 this_wire.add_coincident(cnd_wire)
 
     @property
-    def wire_list(self) -> List[Wire]:
-        """A flat list of all wires"""
-        return self.axes[0].wires + self.axes[1].wires + self.axes[2].wires
+    def wire_list(self) -> Tuple[Wire, ...]:
+        """A flat tuple of all wires"""
+        return self._wire_list
 
     @property
     def edge_list(self) -> List[Edge]:
@@ -1,11 +1,12 @@
 import dataclasses
+import math
 
 import numpy as np
 
 from classy_blocks.construct import edges
-from classy_blocks.construct.point import Point
 from classy_blocks.items.edges.arcs.arc_base import ArcEdgeBase
 from classy_blocks.types import PointType, VectorType
+from classy_blocks.util import constants
 from classy_blocks.util import functions as f
 
 
@@ -15,28 +16,40 @@ def arc_from_theta(edge_point_1: PointType, edge_point_2: PointType, angle: floa
     arc <vertex-1> <vertex-2> <angle> (axis) alternative edge specification:
     https://github.com/OpenFOAM/OpenFOAM-dev/commit/73d253c34b3e184802efb316f996f244cc795ec6
 
+    Points and axes can also be stacked in (N, 3) arrays (with a (N, ) array of angles)
+    to calculate points of many arcs at once.
+
     Note: Meticulously transcribed from
     https://github.com/OpenFOAM/OpenFOAM-dev/blob/master/src/mesh/blockMesh/blockEdges/arcEdge/arcEdge.C
     """
-    if not (0 < abs(angle) < np.pi * 2):
+    angles = np.asarray(angle, dtype=constants.DTYPE)
+
+    if not np.all((0 < np.abs(angles)) & (np.abs(angles) < np.pi * 2)):
         raise ValueError(f"Angle should be between 0 and 2*pi, got {angle}")
 
-    axis = np.asarray(axis)
-    edge_point_1 = np.asarray(edge_point_1)
-    edge_point_2 = np.asarray(edge_point_2)
+    axis = np.asarray(axis, dtype=constants.DTYPE)
+    edge_point_1 = np.asarray(edge_point_1, dtype=constants.DTYPE)
+    edge_point_2 = np.asarray(edge_point_2, dtype=constants.DTYPE)
 
     dp = edge_point_2 - edge_point_1
 
     pm = (edge_point_1 + edge_point_2) / 2
-    rm = f.unit_vector(np.cross(dp, axis))
+    rm = np.cross(dp, axis)
+    rm /= np.linalg.norm(rm, axis=-1, keepdims=True)
 
-    length = np.dot(dp, axis)
+    length = np.einsum("...i,...i->...", dp, axis)[..., np.newaxis]
 
     chord = dp - length * axis
-    mag_chord = f.norm(chord)
+    mag_chord = np.linalg.norm(chord, axis=-1, keepdims=True)
+
+    if np.ndim(angle) == 0:
+        # a single arc; math.tan is much quicker on scalars
+        tan_half = math.tan(angle / 2)
+    else:
+        tan_half = np.tan(angles / 2)[..., np.newaxis]
 
-    center = pm - length * axis / 2 - rm * mag_chord / 2 / np.tan(angle / 2)
-    radius = f.norm(edge_point_1 - center)
+    center = pm - length * axis / 2 - rm * mag_chord / 2 / tan_half
+    radius = np.linalg.norm(edge_point_1 - center, axis=-1)
 
     return f.arc_mid(axis, center, radius, edge_point_1, edge_point_2)
 
@@ -45,12 +58,19 @@ def arc_from_theta(edge_point_1: PointType, edge_point_2: PointType, angle: floa
 class AngleEdge(ArcEdgeBase):
     """Alternative arc edge specification: sector angle and axis"""
 
+    __slots__ = ()
+
     data: edges.Angle
 
     @property
     def third_point(self):
-        return Point(
-            arc_from_theta(self.vertex_1.position, self.vertex_2.position, self.data.angle, self.data.axis.components)
+        position_1 = self.vertex_1.position
+        position_2 = self.vertex_2.position
+        axis = self.data.axis.components
+
+        return self.get_cached_point(
+            (position_1.tobytes(), position_2.tobytes(), self.data.angle, axis.tobytes()),
+            lambda: arc_from_theta(position_1, position_2, self.data.angle, axis),
         )
 
     @property
@@ -8,6 +8,8 @@ from classy_blocks.items.edges.arcs.arc_base import ArcEdgeBase
 class ArcEdge(ArcEdgeBase):
     """Arc edge: defined by a single point"""
 
+    __slots__ = ()
+
     data: edges.Arc
 
     @property
@@ -1,10 +1,12 @@
 import abc
 import dataclasses
+from typing import Callable, Optional, Tuple
 
 import numpy as np
 
 from classy_blocks.construct.point import Point
 from classy_blocks.items.edges.edge import Edge
+from classy_blocks.types import NPPointType
 from classy_blocks.util import constants
 from classy_blocks.util import functions as f
 
@@ -13,11 +15,31 @@ from classy_blocks.util import functions as f
 class ArcEdgeBase(Edge, abc.ABC):
     """Base for all arc-based edges (arc, origin, angle)"""
 
+    # alternative specifications need trigonometry to find the third point;
+    # it is cached and recalculated only when the key changes (see get_cached_point())
+    __slots__ = ("_point_key", "_point_position")
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        self._point_key: Optional[Tuple] = None
+        self._point_position: Optional[NPPointType] = None
+
     @property
     @abc.abstractmethod
     def third_point(self) -> Point:
         """The third point that defines the arc, regardless of how it was specified"""
 
+    def get_cached_point(self, key: Tuple, calculate: Callable[[], NPPointType]) -> Point:
+        """Returns a Point at the cached position if the key (anything that defines
+        the arc, including vertex positions) is the same as the last time,
+        otherwise calculates and caches a new one"""
+        if self._point_position is None or key != self._point_key:
+            self._point_position = calculate()
+            self._point_key = key
+
+        return Point(self._point_position)
+
     @property
     def length(self) -> float:
         if self.is_valid:
@@ -40,10 +62,11 @@ class ArcEdgeBase(Edge, abc.ABC):
             # are actually collinear, this edge is redundant and can be
             # silently dropped
 
-            # cross-product of three collinear vertices must be zero
-            arm_1 = self.vertex_1.position - self.third_point.position
-            arm_2 = self.vertex_2.position - self.third_point.position
+            # cross-product of three collinear vertices must be zero;
+            # compare squared magnitudes to skip the square root
+            third_point = self.third_point.position
+            cross = np.cross(self.vertex_1.position - third_point, self.vertex_2.position - third_point)
 
-            return abs(f.norm(np.cross(arm_1, arm_2))) > constants.TOL
+            return bool(np.dot(cross, cross) > constants.TOL**2)
 
         return False
@@ -5,7 +5,6 @@ from typing import ClassVar
 import numpy as np
 
 from classy_blocks.construct import edges
-from classy_blocks.construct.point import Point
 from classy_blocks.items.edges.arcs.arc_base import ArcEdgeBase
 from classy_blocks.types import NPPointType
 from classy_blocks.util import constants
@@ -80,6 +79,8 @@ def arc_from_origin(
 class OriginEdge(ArcEdgeBase):
     """Alternative arc edge specification: origin and radius multiplier"""
 
+    __slots__ = ()
+
     data: edges.Origin
 
     adjust_center: ClassVar[bool] = True
@@ -87,19 +88,23 @@ class OriginEdge(ArcEdgeBase):
     @property
     def third_point(self):
         """Calculated arc point from origin and flatness"""
-        point = arc_from_origin(
-            self.vertex_1.position,
-            self.vertex_2.position,
-            self.data.origin.position,
-            self.adjust_center,
-            self.data.flatness,
-        )
+        position_1 = self.vertex_1.position
+        position_2 = self.vertex_2.position
+        origin = self.data.origin.position
+
+        def calculate():
+            point = arc_from_origin(position_1, position_2, origin, self.adjust_center, self.data.flatness)
 
-        if np.any(np.isnan(point)):
-            # try to create a friendly error message :/
-            raise ValueError(f"Invalid edge specification: {self}")
+            if np.any(np.isnan(point)):
+                # try to create a friendly error message :/
+                raise ValueError(f"Invalid edge specification: {self}")
 
-        return Point(point)
+            return point
+
+        return self.get_cached_point(
+            (position_1.tobytes(), position_2.tobytes(), origin.tobytes(), self.data.flatness, self.adjust_center),
+            calculate,
+        )
 
     @property
     def description(self):
@@ -4,9 +4,9 @@ import dataclasses
 import numpy as np
 
 from classy_blocks.construct import edges
-from classy_blocks.construct.curves.discrete import DiscreteCurve
 from classy_blocks.items.edges.edge import Edge
 from classy_blocks.types import EdgeKindType, NPPointListType
+from classy_blocks.util import functions as f
 from classy_blocks.util.constants import vector_format
 
 
@@ -14,6 +14,8 @@ class CurveEdgeBase(Edge, abc.ABC):
     """Base class for edges of any curved shape,
     defined as a list of points"""
 
+    __slots__ = ()
+
     data: edges.OnCurve
 
     @property
@@ -31,7 +33,8 @@ class CurveEdgeBase(Edge, abc.ABC):
 
     @property
     def description(self):
-        point_list = " ".join([vector_format(p) for p in self.point_array])
+        # plain floats are formatted quicker than numpy's scalars
+        point_list = " ".join([vector_format(p) for p in self.point_array.tolist()])
         return super().description + "(" + point_list + ")"
 
 
@@ -39,6 +42,8 @@ class CurveEdgeBase(Edge, abc.ABC):
 class SplineEdge(CurveEdgeBase):
     """Spline edge, defined by multiple points"""
 
+    __slots__ = ()
+
     data: edges.Spline
 
     @property
@@ -49,13 +54,15 @@ class SplineEdge(CurveEdgeBase):
     def length(self):
         points = np.concatenate(([self.vertex_1.position], self.point_array, [self.vertex_2.position]))
 
-        return DiscreteCurve(points).length
+        return f.polyline_length(points)
 
 
 @dataclasses.dataclass
 class PolyLineEdge(SplineEdge):
     """PolyLine variant of SplineEdge"""
 
+    __slots__ = ()
+
     data: edges.PolyLine
 
 
@@ -63,6 +70,8 @@ class PolyLineEdge(SplineEdge):
 class OnCurveEdge(CurveEdgeBase):
     """Spline edge, defined by a parametric curve"""
 
+    __slots__ = ()
+
     data: edges.OnCurve
 
     @property
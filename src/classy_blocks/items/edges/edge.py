@@ -1,7 +1,9 @@
 import abc
 import dataclasses
 import warnings
+from typing import List
 
+from classy_blocks.base import transforms as tr
 from classy_blocks.base.element import ElementBase
 from classy_blocks.base.exceptions import EdgeCreationError
 from classy_blocks.construct.edges import EdgeData
@@ -15,6 +17,10 @@ from classy_blocks.util import functions as f
 class Edge(ElementBase):
     """Common stuff for all edge objects"""
 
+    # dataclass(slots=True) needs python 3.10;
+    # subclasses must declare their own (empty) slots too
+    __slots__ = ("data", "vertex_1", "vertex_2")
+
     vertex_1: Vertex
     vertex_2: Vertex
     data: EdgeData
@@ -39,10 +45,6 @@ class Edge(ElementBase):
     @property
     def is_valid(self) -> bool:
         """Returns True if this edge is elligible to be put into blockMeshDict"""
-        if self.kind == "line":
-            # no need to specify lines
-            return False
-
         # wedge geometries produce coincident
         # edges and vertices; drop those
         if f.norm(self.vertex_1.position - self.vertex_2.position) < constants.TOL:
@@ -73,3 +75,20 @@ class Edge(ElementBase):
     @property
     def parts(self):
         return [self.vertex_1, self.vertex_2, self.data]
+
+    def transform(self, transforms: List[tr.Transformation]) -> "Edge":
+        """Passes all transforms to each part at once so that curved edge data
+        can compose them and move its points in a single pass"""
+        resolved: List[tr.Transformation] = []
+
+        for t7m in transforms:
+            if isinstance(t7m, (tr.Rotation, tr.Scaling)) and t7m.origin is None:
+                # edge's center does not move with the edge; it's the same for all transforms
+                t7m = dataclasses.replace(t7m, origin=self.center)
+
+            resolved.append(t7m)
+
+        for part in self.parts:
+            part.transform(resolved)
+
+        return self
@@ -1,5 +1,7 @@
-from typing import Type
+from typing import Dict, Type, Union
 
+from classy_blocks.base.exceptions import EdgeCreationError
+from classy_blocks.construct import edges
 from classy_blocks.construct.edges import EdgeData
 from classy_blocks.items.edges.arcs.angle import AngleEdge
 from classy_blocks.items.edges.arcs.arc import ArcEdge
@@ -17,25 +19,46 @@ class EdgeFactory:
     """Generates edges as requested by the user or returns existing ones
     if they are defined already"""
 
-    def __init__(self):
-        self.kinds = {}
+    def __init__(self) -> None:
+        # edge classes, addressed directly by the type of edge data
+        self.kinds: Dict[Type[EdgeData], Type[Edge]] = {}
 
-    def register_kind(self, kind: EdgeKindType, creator: Type[Edge]) -> None:
-        """Introduces a new edge kind to this factory"""
-        self.kinds[kind] = creator
+    def register_kind(self, data_class: Union[Type[EdgeData], EdgeKindType], creator: Type[Edge]) -> None:
+        """Introduces a new edge kind to this factory;
+        for backwards compatibility, an already registered kind can also
+        be addressed by its name ('arc', 'spline', ...)"""
+        if isinstance(data_class, str):
+            registered = {registered_class.kind: registered_class for registered_class in self.kinds}
+
+            if data_class not in registered:
+                raise EdgeCreationError(f"Unknown edge kind: {data_class}")
+
+            data_class = registered[data_class]
+
+        self.kinds[data_class] = creator
+
+    def get_class(self, data_class: Type[EdgeData]) -> Type[Edge]:
+        """Returns the edge class that was registered for given data class
+        or, for subclassed edge data, for its closest registered parent"""
+        # the data class itself is the first item in its MRO
+        for parent in data_class.__mro__:
+            if parent in self.kinds:
+                return self.kinds[parent]
+
+        raise EdgeCreationError(f"Unknown edge data type: {data_class}")
 
     def create(self, vertex_1, vertex_2, data: EdgeData) -> Edge:
         """Creates an Edge* of the desired kind and returns it"""
-        edge_class = self.kinds[data.kind]
+        edge_class = self.get_class(type(data))
         return edge_class(vertex_1, vertex_2, data)
 
 
 factory = EdgeFactory()
-factory.register_kind("line", LineEdge)
-factory.register_kind("arc", ArcEdge)
-factory.register_kind("origin", OriginEdge)
-factory.register_kind("angle", AngleEdge)
-factory.register_kind("spline", SplineEdge)
-factory.register_kind("curve", OnCurveEdge)
-factory.register_kind("polyLine", PolyLineEdge)
-factory.register_kind("project", ProjectEdge)
+factory.register_kind(edges.Line, LineEdge)
+factory.register_kind(edges.Arc, ArcEdge)
+factory.register_kind(edges.Origin, OriginEdge)
+factory.register_kind(edges.Angle, AngleEdge)
+factory.register_kind(edges.Spline, SplineEdge)
+factory.register_kind(edges.OnCurve, OnCurveEdge)
+factory.register_kind(edges.PolyLine, PolyLineEdge)
+factory.register_kind(edges.Project, ProjectEdge)
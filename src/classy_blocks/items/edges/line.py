@@ -8,8 +8,15 @@ from classy_blocks.items.edges.edge import Edge
 class LineEdge(Edge):
     """A default Line edge; doesn't need an explicit definition and is not output to blockMeshDict"""
 
+    __slots__ = ()
+
     data: edges.Line
 
+    @property
+    def is_valid(self):
+        # no need to specify lines
+        return False
+
     @property
     def length(self):
         # straight line
@@ -8,6 +8,8 @@ from classy_blocks.items.edges.edge import Edge
 class ProjectEdge(Edge):
     """Edge, projected to a specified geometry"""
 
+    __slots__ = ()
+
     data: edges.Project
 
     @property
@@ -8,6 +8,8 @@ from classy_blocks.util.constants import vector_format
 class Vertex(Point):
     """A 3D point in space with all transformations and an assigned index"""
 
+    __slots__ = ("index",)
+
     # keep the list as a class variable
     def __init__(self, position: PointType, index: int):
         super().__init__(position)
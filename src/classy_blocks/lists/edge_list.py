@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Dict, FrozenSet, List, Tuple
 
 from classy_blocks.base.exceptions import EdgeNotFoundError
 from classy_blocks.construct.edges import EdgeData
@@ -14,14 +14,17 @@ class EdgeList:
     def __init__(self) -> None:
         self.edges: List[Edge] = []
 
+        # the same edges, addressed by an (unordered) pair of vertex indexes
+        # for quicker lookup; self.edges keeps the order for output
+        self.index: Dict[FrozenSet[int], Edge] = {}
+
     def find(self, vertex_1: Vertex, vertex_2: Vertex) -> Edge:
         """checks if an edge with the same pair of vertices
         exists in self.edges already"""
-        for edge in self.edges:
-            if {vertex_1.index, vertex_2.index} == {edge.vertex_1.index, edge.vertex_2.index}:
-                return edge
-
-        raise EdgeNotFoundError(f"Edge not found: {vertex_1}, {vertex_2}")
+        try:
+            return self.index[frozenset((vertex_1.index, vertex_2.index))]
+        except KeyError as err:
+            raise EdgeNotFoundError(f"Edge not found: {vertex_1}, {vertex_2}") from err
 
     def add(self, vertex_1: Vertex, vertex_2: Vertex, data: EdgeData) -> Edge:
         """Adds an edge between given vertices or returns an existing one"""
@@ -34,6 +37,7 @@ class EdgeList:
 
             if edge.is_valid:
                 self.edges.append(edge)
+                self.index[frozenset((vertex_1.index, vertex_2.index))] = edge
 
         return edge
 
@@ -57,6 +61,7 @@ class EdgeList:
     def clear(self) -> None:
         """Empties all lists"""
         self.edges.clear()
+        self.index.clear()
 
     @property
     def description(self) -> str:
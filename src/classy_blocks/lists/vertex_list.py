@@ -1,11 +1,18 @@
-from typing import List, Optional
+import itertools
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from classy_blocks.base.exceptions import VertexNotFoundError
 from classy_blocks.construct.point import Point
 from classy_blocks.items.vertex import Vertex
-from classy_blocks.types import NPPointType
+from classy_blocks.types import NPPointListType, NPPointType
 from classy_blocks.util import constants
-from classy_blocks.util import functions as f
+
+CellType = Tuple[int, int, int]
+
+# offsets of a lattice cell and all of its neighbours
+NEIGHBOURS: List[CellType] = list(itertools.product((-1, 0, 1), (-1, 0, 1), (-1, 0, 1)))
 
 
 class DuplicatedEntry:
@@ -28,18 +35,28 @@ class VertexList:
     def __init__(self) -> None:
         self.vertices: List[Vertex] = []
 
+        # positions of self.vertices in a single contiguous array
+        # for searching; it grows by doubling, unused rows are garbage
+        self._positions = np.empty((64, 3), dtype=constants.DTYPE)
+
         # a collection of duplicated vertices
-        # belonging to a certain patch name
-        self.duplicated: List[DuplicatedEntry] = []
+        # belonging to a certain patch name, addressed by vertex index
+        self.duplicated: Dict[int, DuplicatedEntry] = {}
+
+        # indexes of vertices, sorted into cells of a lattice with spacing of TOL;
+        # vertices closer than TOL to a given point can only be in the point's cell
+        # or one of its neighbours
+        self.grid: Dict[CellType, List[int]] = {}
 
     def find_duplicated(self, position: NPPointType, slave_patches: List[str]) -> Vertex:
         """Finds an appropriate entry in self.duplicated, if any"""
         slave_patches.sort()
 
-        for dupe in self.duplicated:
-            if f.norm(position - dupe.point) < constants.TOL:
-                if dupe.patches == slave_patches:
-                    return dupe.vertex
+        for index in self._find_near(position):
+            dupe = self.duplicated.get(index)
+
+            if dupe is not None and dupe.patches == slave_patches:
+                return dupe.vertex
 
         raise VertexNotFoundError(f"No duplicated vertex found: {position} {slave_patches}")
 
@@ -47,17 +64,55 @@ class VertexList:
         """checks if any of existing vertices in self.vertices are
         in the same location as the passed one; if so, returns
         the existing vertex"""
-        for vertex in self.vertices:
-            if f.norm(vertex.position - position) < constants.TOL:
-                return vertex
+        near = self._find_near(position)
+
+        if len(near) > 0:
+            return self.vertices[near[0]]
 
         raise VertexNotFoundError(f"Vertex not found: {position}")
 
+    @staticmethod
+    def _get_cell(position: NPPointType) -> CellType:
+        """Lattice cell that contains given position"""
+        i, j, k = np.rint(position / constants.TOL).astype(np.int64).tolist()
+
+        return (i, j, k)
+
+    def _find_near(self, position: NPPointType) -> List[int]:
+        """Returns sorted indexes of all vertices at the given position"""
+        i, j, k = self._get_cell(position)
+
+        candidates: List[int] = []
+
+        for di, dj, dk in NEIGHBOURS:
+            candidates += self.grid.get((i + di, j + dj, k + dk), [])
+
+        if len(candidates) == 0:
+            return []
+
+        candidates.sort()
+        distances = np.linalg.norm(self._positions[candidates] - position, axis=1)
+
+        return [index for index, distance in zip(candidates, distances) if distance < constants.TOL]
+
+    def _append(self, point: Point) -> Vertex:
+        """Creates a new vertex at the end of the list"""
+        index = len(self.vertices)
+
+        if index == len(self._positions):
+            self._positions = np.concatenate((self._positions, np.empty_like(self._positions)))
+
+        vertex = Vertex.from_point(point, index)
+        self.vertices.append(vertex)
+        self._positions[index] = vertex.position
+        self.grid.setdefault(self._get_cell(vertex.position), []).append(index)
+
+        return vertex
+
     def add(self, point: Point, slave_patches: Optional[List[str]] = None) -> Vertex:
         """Re-use existing vertices when there's already one at the position;
         unless that vertex belongs to a slave of a face-merged pair -
         in that case add a duplicate in the same position anyway"""
-
         # different scenarios:
         # 1. add a new vertex, nothing exist at this location yet
         # 2. reuse an existing vertex at this location
@@ -70,14 +125,12 @@ class VertexList:
                 vertex = self.find_unique(point.position)
 
                 # scenario #4:
-                for dupe in self.duplicated:
-                    if dupe.vertex == vertex:
-                        # a point that belongs to a slave patch
-                        # has been found but we need one for a 'master' patch
-                        raise VertexNotFoundError
+                if vertex.index in self.duplicated:
+                    # a point that belongs to a slave patch
+                    # has been found but we need one for a 'master' patch
+                    raise VertexNotFoundError
             except VertexNotFoundError:
-                vertex = Vertex.from_point(point, len(self.vertices))
-                self.vertices.append(vertex)
+                vertex = self._append(point)
 
             return vertex
 
@@ -85,9 +138,8 @@ class VertexList:
         try:
             vertex = self.find_duplicated(point.position, slave_patches)
         except VertexNotFoundError:
-            vertex = Vertex.from_point(point, len(self.vertices))
-            self.vertices.append(vertex)
-            self.duplicated.append(DuplicatedEntry(vertex, slave_patches))
+            vertex = self._append(point)
+            self.duplicated[vertex.index] = DuplicatedEntry(vertex, slave_patches)
 
         return vertex
 
@@ -96,6 +148,14 @@ class VertexList:
         self.vertices.clear()
         self.duplicated.clear()
 
+        self._positions = np.empty((64, 3), dtype=constants.DTYPE)
+        self.grid.clear()
+
+    @property
+    def positions(self) -> NPPointListType:
+        """Positions of all vertices in a single array"""
+        return self._positions[: len(self.vertices)]
+
     @property
     def description(self) -> str:
         """Output for blockMeshDict"""
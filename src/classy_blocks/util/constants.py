@@ -44,10 +44,13 @@ EDGE_PAIRS = list(AXIS_PAIRS[0]) + list(AXIS_PAIRS[1]) + list(AXIS_PAIRS[2])
 
 
 # number formatting
+# ACHTUNG, keep about the same order of magnitude than TOL
+_VECTOR_FORMAT = "({:.8f} {:.8f} {:.8f})".format
+
+
 def vector_format(vector) -> str:
     """Output for point/vertex definitions"""
-    # ACHTUNG, keep about the same order of magnitude than TOL
-    return f"({vector[0]:.8f} {vector[1]:.8f} {vector[2]:.8f})"
+    return _VECTOR_FORMAT(*vector)
 
 
 MESH_HEADER = (
@@ -21,22 +21,31 @@ class Frame(Generic[BeamT]):
     After the Frame is created, entities must be added separately
     with appropriate methods."""
 
-    valid_pairs: ClassVar[List[Set[int]]] = [set(pair) for pair in constants.EDGE_PAIRS]
+    # an unordered pair of corners (0...7) is packed into a bit mask
+    # with one bit set for each corner; see get_pair_key()
+    valid_pairs: ClassVar[Set[int]] = {(1 << pair[0]) | (1 << pair[1]) for pair in constants.EDGE_PAIRS}
 
     def __init__(self) -> None:
         self.beams: List[Dict[int, Optional[BeamT]]] = [{} for _ in range(8)]
 
-        # create wires and connections for quicker addressing
-        for axis in (0, 1, 2):
-            for pair in constants.AXIS_PAIRS[axis]:
-                self.add_beam(pair[0], pair[1], None)
+        # create wires and connections for quicker addressing;
+        # EDGE_PAIRS are valid by definition so there's no need to check them in add_beam()
+        for corner_1, corner_2 in constants.EDGE_PAIRS:
+            self.beams[corner_1][corner_2] = None
+            self.beams[corner_2][corner_1] = None
+
+    @staticmethod
+    def get_pair_key(corner_1: int, corner_2: int) -> int:
+        """Returns an integer that identifies an unordered pair of corners;
+        the same corner twice (a degenerate pair) only sets a single bit"""
+        return (1 << corner_1) | (1 << corner_2)
 
     def add_beam(self, corner_1: int, corner_2: int, beam: Optional[BeamT]) -> None:
         """Adds an element between given corners;
         raises an exception if the given pair does not represent a beam"""
-        if {corner_1, corner_2} not in self.valid_pairs:
+        if self.get_pair_key(corner_1, corner_2) not in self.valid_pairs:
             raise ValueError(
-                f"Invalid combination of corners. Valid pairs: {self.valid_pairs}, got: {corner_1, corner_2}"
+                f"Invalid combination of corners. Valid pairs: {constants.EDGE_PAIRS}, got: {corner_1, corner_2}"
             )
 
         self.beams[corner_1][corner_2] = beam
@@ -57,17 +66,16 @@ class Frame(Generic[BeamT]):
     def get_all_beams(self) -> List[Tuple[int, int, BeamT]]:
         """Returns all non-None entries in self.beams"""
         beams = []
-        listed = []
 
         for corner_1, pairs in enumerate(self.beams):
             for corner_2, beam in pairs.items():
-                pair = {corner_1, corner_2}
-                if pair in listed:
+                # each beam is stored in both directions;
+                # take it only once, from the lower corner
+                if corner_2 < corner_1:
                     continue
 
                 if beam is not None:
                     beams.append((corner_1, corner_2, beam))
-                    listed.append(pair)
 
         return beams
 
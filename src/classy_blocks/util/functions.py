@@ -1,4 +1,5 @@
 """Mathematical functions for general everyday household use"""
+import math
 from typing import Literal, Optional, Union
 
 import numpy as np
@@ -6,6 +7,7 @@ import scipy
 import scipy.linalg
 import scipy.optimize
 import scipy.spatial
+from numpy.typing import NDArray
 
 from classy_blocks.types import NPPointType, NPVectorType, PointListType, PointType, VectorType
 from classy_blocks.util import constants
@@ -60,41 +62,44 @@ def angle_between(vect_1: VectorType, vect_2: VectorType) -> float:
     return np.arccos(np.clip(np.dot(v1_u, v2_u), -1.0, 1.0))
 
 
-def rotation_matrix(axis: VectorType, theta: float):
+def rotation_matrix(axis: VectorType, theta: float) -> NDArray:
     """
     Return the rotation matrix associated with counterclockwise rotation about
     the given axis by theta radians.
-    # Kudos to
-    # https://stackoverflow.com/questions/6802577/rotation-of-3d-vector
-    #import math
-    #
-    # axis = np.asarray(axis)
-    # axis = axis / math.sqrt(np.dot(axis, axis))
-    # a = math.cos(theta / 2.0)
-    # b, c, d = -axis * math.sin(theta / 2.0)
-    # aa, bb, cc, dd = a * a, b * b, c * c, d * d
-    # bc, ad, ac, ab, bd, cd = b * c, a * d, a * c, a * b, b * d, c * d
-    # return np.array([[aa + bb - cc - dd, 2 * (bc + ad), 2 * (bd - ac)],
-    #                  [2 * (bc - ad), aa + cc - bb - dd, 2 * (cd + ab)],
-    #                  [2 * (bd + ac), 2 * (cd - ab), aa + dd - bb - cc]])
-
-    # Also Kudos to the guy with another answer for the same question (used here):"""
-    axis = np.asarray(axis)
-    return scipy.linalg.expm(np.cross(np.eye(3), axis / norm(axis) * theta))
-
-
-def rotate(point: PointType, angle: float, axis: VectorType, origin: PointType) -> NPPointType:
-    """Rotate a point around an axis@origin by a given angle [radians]"""
+
+    Rodrigues' rotation formula in matrix form: R = I + sin(theta)*K + (1 - cos(theta))*K^2,
+    where K is the cross-product matrix of the unit axis
+    https://en.wikipedia.org/wiki/Rodrigues%27_rotation_formula
+
+    This is the only implementation of rotation; f.rotate() and affine_rotation() both use it."""
+    axis = unit_vector(axis)
+    cross = np.cross(np.eye(3), axis)
+
+    # theta is a scalar; math's functions skip numpy's dispatch;
+    # snap round-off of right angles (cos(pi/2) == 6e-17) to exact zeros
+    sin = math.sin(theta)
+    if abs(sin) < np.finfo(constants.DTYPE).eps:
+        sin = 0.0
+
+    cos = math.cos(theta)
+    if abs(cos) < np.finfo(constants.DTYPE).eps:
+        cos = 0.0
+
+    return np.eye(3) + sin * cross + (1 - cos) * np.dot(cross, cross)
+
+
+def rotate(point: Union[PointType, PointListType], angle: float, axis: VectorType, origin: PointType) -> NPPointType:
+    """Rotate a point around an axis@origin by a given angle [radians];
+    an array of points of shape (N, 3) is rotated in a single go"""
     point = np.asarray(point, dtype=constants.DTYPE)
-    axis = np.asarray(axis, dtype=constants.DTYPE)
     origin = np.asarray(origin, dtype=constants.DTYPE)
 
-    rotated_point = np.dot(rotation_matrix(axis, angle), point - origin)
-    return rotated_point + origin
+    # the same matrix for all points
+    return np.dot(point - origin, rotation_matrix(axis, angle).T) + origin
 
 
-def scale(point: PointType, ratio: float, origin: Optional[PointType]) -> NPPointType:
-    """Scales a point around origin by specified ratio;
+def scale(point: Union[PointType, PointListType], ratio: float, origin: Optional[PointType]) -> NPPointType:
+    """Scales a point (or an array of points) around origin by specified ratio;
     if not specified, origin is taken as [0, 0, 0]."""
     point = np.asarray(point, dtype=constants.DTYPE)
     origin = np.asarray(origin, dtype=constants.DTYPE)
@@ -102,6 +107,45 @@ def scale(point: PointType, ratio: float, origin: Optional[PointType]) -> NPPoin
     return origin + (point - origin) * ratio
 
 
+def affine_translation(displacement: VectorType) -> NDArray:
+    """Returns a 4x4 affine matrix that translates points by displacement"""
+    matrix = np.eye(4)
+    matrix[:3, 3] = displacement
+
+    return matrix
+
+
+def affine_rotation(angle: float, axis: VectorType, origin: PointType) -> NDArray:
+    """Returns a 4x4 affine matrix that rotates points around an axis@origin by a given angle [radians]"""
+    origin = np.asarray(origin, dtype=constants.DTYPE)
+    rotation = rotation_matrix(axis, angle)
+
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation
+    matrix[:3, 3] = origin - np.dot(rotation, origin)
+
+    return matrix
+
+
+def affine_scaling(ratio: float, origin: PointType) -> NDArray:
+    """Returns a 4x4 affine matrix that scales points around origin by specified ratio"""
+    origin = np.asarray(origin, dtype=constants.DTYPE)
+
+    matrix = np.eye(4)
+    matrix[:3, :3] *= ratio
+    matrix[:3, 3] = origin * (1 - ratio)
+
+    return matrix
+
+
+def apply_affine(matrix: NDArray, point: Union[PointType, PointListType]) -> NDArray:
+    """Transforms a point or an array of points of shape (N, 3)
+    with a 4x4 affine matrix"""
+    point = np.asarray(point, dtype=constants.DTYPE)
+
+    return np.dot(point, matrix[:3, :3].T) + matrix[:3, 3]
+
+
 def to_polar(point: PointType, axis: Literal["x", "z"] = "z") -> NPVectorType:
     """Convert (x, y, z) point to (radius, angle, height);
     the axis of the new polar coordinate system can be chosen ('x' or 'z')"""
@@ -156,6 +200,13 @@ def lin_map(x: float, x_min: float, x_max: float, out_min: float, out_max: float
         return r
 
 
+def polyline_length(points: PointListType) -> float:
+    """Returns the length of a polyline through given points (sum of segment lengths)"""
+    segments = np.diff(np.asarray(points, dtype=constants.DTYPE), axis=0)
+
+    return float(np.sum(np.sqrt(np.einsum("ij,ij->i", segments, segments))))
+
+
 def arc_length_3point(p_start: NPPointType, p_btw: NPPointType, p_end: NPPointType) -> float:
     """Returns length of arc defined by 3 points"""
     ### Meticulously transcribed from
@@ -200,15 +251,18 @@ def arc_length_3point(p_start: NPPointType, p_btw: NPPointType, p_end: NPPointTy
 
 
 def arc_mid(axis: VectorType, center: PointType, radius: float, point_1: PointType, point_2: PointType) -> PointType:
-    """Returns the midpoint of the specified arc in 3D space"""
+    """Returns the midpoint of the specified arc in 3D space;
+    points and axes can also be stacked in (N, 3) arrays (with a (N, ) array of radii)
+    to calculate midpoints of many arcs at once"""
     # Kudos to this guy for his shrewd solution
     # https://math.stackexchange.com/questions/3717427
     axis = np.asarray(axis, dtype=constants.DTYPE)
     center = np.asarray(center, dtype=constants.DTYPE)
     point_1 = np.asarray(point_1, dtype=constants.DTYPE)
     point_2 = np.asarray(point_2, dtype=constants.DTYPE)
+    radii = np.asarray(radius, dtype=constants.DTYPE)[..., np.newaxis]
 
     sec = point_2 - point_1
     sec_ort = np.cross(sec, axis)
 
-    return center + unit_vector(sec_ort) * radius
+    return center + sec_ort / np.linalg.norm(sec_ort, axis=-1, keepdims=True) * radii
@@ -3,6 +3,7 @@ import unittest
 import numpy as np
 from parameterized import parameterized
 
+from classy_blocks.base import transforms as tr
 from classy_blocks.construct.curves.discrete import DiscreteCurve
 
 
@@ -40,6 +41,14 @@ class DiscreteCurveTests(unittest.TestCase):
         """Call discretize() without params"""
         np.testing.assert_equal(self.curve.discretize(), self.points)
 
+    def test_point_array(self):
+        """Integer points are stored as floats in a single contiguous array"""
+        point_array = self.curve.point_array
+
+        self.assertEqual(point_array.dtype, np.float64)
+        self.assertTrue(point_array.flags["C_CONTIGUOUS"])
+        np.testing.assert_array_equal(point_array, self.points)
+
     def test_discretize_partial(self):
         """Discretize with given params"""
         np.testing.assert_equal(self.curve.discretize(1, 3), self.points[1:4])
@@ -51,6 +60,23 @@ class DiscreteCurveTests(unittest.TestCase):
 
         np.testing.assert_equal(discretized, expected)
 
+    def test_discretize_modified(self):
+        """Modifying discretized points must not affect the curve"""
+        curve = self.curve
+        discretized = curve.discretize()
+        discretized[0] = [1, 1, 1]
+
+        np.testing.assert_equal(curve.discretize(), self.points)
+
+    def test_discretize_translated(self):
+        """Discretized points must follow transformations"""
+        curve = self.curve
+        _ = curve.discretize()
+
+        curve.translate([0, 0, 1])
+
+        np.testing.assert_equal(curve.discretize(), np.array(self.points) + np.array([0, 0, 1]))
+
     def test_length(self):
         self.assertEqual(self.curve.length, sum(self.segment_lengths))
 
@@ -67,6 +93,24 @@ class DiscreteCurveTests(unittest.TestCase):
 
         self.assertEqual(self.curve.get_length(param_from, param_to), length)
 
+    def test_length_scaled(self):
+        """Cached lengths must be updated after transformation"""
+        curve = self.curve
+        _ = curve.length
+
+        curve.scale(2, [0, 0, 0])
+
+        self.assertAlmostEqual(curve.length, 2 * sum(self.segment_lengths))
+
+    @parameterized.expand(((1, 3), (3, 1), (2, 3)))
+    def test_get_length_partial(self, param_from, param_to):
+        """Length between inner points, regardless of direction"""
+        index_from = min(param_from, param_to)
+        index_to = max(param_from, param_to)
+        length = sum(self.segment_lengths[index_from:index_to])
+
+        self.assertAlmostEqual(self.curve.get_length(param_from, param_to), length)
+
     @parameterized.expand(
         (
             ([0, -1, 0], 0),
@@ -100,3 +144,37 @@ class DiscreteCurveTests(unittest.TestCase):
                 [6, 18, 0],
             ],
         )
+
+    def test_rotate(self):
+        rotated = self.curve.rotate(np.pi / 2, [0, 0, 1], [0, 0, 0])
+
+        np.testing.assert_array_almost_equal(
+            rotated.discretize(),
+            [
+                [0, 0, 0],
+                [-1, 1, 0],
+                [-4, 2, 0],
+                [-9, 3, 0],
+            ],
+        )
+
+    def test_transform_composed(self):
+        """Multiple transforms at once give the same
+        result as consecutive transforms"""
+        transforms = [
+            tr.Translation([1, 0, 0]),
+            tr.Rotation([0, 0, 1], np.pi / 2),
+            tr.Scaling(2),
+            tr.Rotation([1, 0, 0], np.pi / 3, [0, 1, 0]),
+        ]
+
+        expected = self.curve
+        expected.translate([1, 0, 0])
+        expected.rotate(np.pi / 2, [0, 0, 1])
+        expected.scale(2)
+        expected.rotate(np.pi / 3, [1, 0, 0], [0, 1, 0])
+
+        curve = self.curve
+        curve.transform(transforms)
+
+        np.testing.assert_array_almost_equal(curve.discretize(), expected.discretize())
@@ -1,4 +1,5 @@
 import unittest
+import warnings
 
 import numpy as np
 
@@ -16,6 +17,14 @@ class EdgeDataTests(unittest.TestCase):
         """Create a Line edge data"""
         _ = edges.Line()
 
+    def test_arc_copy(self):
+        """Copy Arc edge data; the copy must not share points with the original"""
+        arc = edges.Arc([0.5, 0.25, 0])
+        copied = arc.copy().translate([1, 0, 0])
+
+        np.testing.assert_array_almost_equal(arc.point.position, [0.5, 0.25, 0])
+        np.testing.assert_array_almost_equal(copied.point.position, [1.5, 0.25, 0])
+
     def test_arc_transform(self):
         """Create and transform Arc edge data"""
         arc = edges.Arc([0.5, 0.25, 0])
@@ -99,6 +108,14 @@ class EdgeDataTests(unittest.TestCase):
 
         self.assertEqual(edge.label, ["terrain", "walls"])
 
+    def test_add_label_shared(self):
+        """Adding a label to an edge does not change other edges with the same label"""
+        edge_1 = edges.Project("terrain")
+        edge_2 = edges.Project("terrain")
+        edge_1.add_label("walls")
+
+        self.assertEqual(edge_2.label, ["terrain"])
+
     def test_add_too_many(self):
         """Add too many labels to a project edge"""
         edge = edges.Project("terrain")
@@ -109,11 +126,29 @@ class EdgeDataTests(unittest.TestCase):
     def test_default_transform(self):
         """Issue a warning error when transforming an edge
         with a default center"""
-        edge = edges.Line()
+        edge = edges.Arc([0.5, 0.25, 0])
 
         with self.assertWarns(Warning):
             edge.rotate(1, [0, 0, 1])
 
+    def test_line_transform(self):
+        """Lines have nothing to transform; no default center is needed"""
+        edge = edges.Line()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertIs(edge.rotate(1, [0, 0, 1]).scale(2), edge)
+
+    def test_project_transform(self):
+        """Projected edges follow geometry and are left as they are"""
+        edge = edges.Project("terrain")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            edge.translate([1, 0, 0]).rotate(1, [0, 0, 1]).scale(2)
+
+        self.assertListEqual(edge.label, ["terrain"])
+
     def test_default_repr(self):
         self.assertEqual(edges.Line().representation, "line")
 
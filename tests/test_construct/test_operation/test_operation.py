@@ -85,6 +85,13 @@ class OperationTests(BlockTestCase):
 
         self.assertEqual(len(self.loft.chops[0]), 1)
 
+    def test_chop_other_axes(self):
+        """Chopping one axis leaves others empty"""
+        self.loft.chop(1, count=10)
+
+        self.assertEqual(len(self.loft.chops[0]), 0)
+        self.assertEqual(len(self.loft.chops[2]), 0)
+
     def test_unchop(self):
         """Chop, unchop and check"""
         self.loft.chop(0, count=10)
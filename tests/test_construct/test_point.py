@@ -34,6 +34,12 @@ class PointTests(unittest.TestCase):
         """Rotation without an origin"""
         np.testing.assert_array_almost_equal(self.point.scale(2).position, [2, 2, 2])
 
+    def test_default_origin_unchanged(self):
+        """Transforming a point doesn't modify the shared default origin"""
+        Point([1, 1, 1]).scale(2).translate([1, 0, 0])
+
+        np.testing.assert_array_almost_equal(Point([1, 1, 1]).scale(2).position, [2, 2, 2])
+
     def test_center(self):
         """Center property"""
         np.testing.assert_array_equal(self.point.center, self.point.position)
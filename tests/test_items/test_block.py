@@ -34,6 +34,13 @@ class BlockTests(BlockTestCase):
             block_0.wires[this_corners[0]][this_corners[1]].coincidents, {block_1.wires[nei_corners[0]][nei_corners[1]]}
         )
 
+    def test_wire_list(self):
+        """All 12 wires, ordered by axes"""
+        block = self.make_block(0)
+
+        self.assertEqual(len(block.wire_list), 12)
+        self.assertTupleEqual(block.wire_list[:4], tuple(block.axes[0].wires))
+
     def test_add_neighbour_1_axes(self):
         """Two blocks that share a 'side' a.k.a. face"""
         block_0 = self.make_block(0)
@@ -293,9 +300,10 @@ class WireframeTests(BlockTestCase):
         block = self.make_block(block_index)
         self.assertEqual(len(block.edge_list), edge_count)
 
-    def test_index_exception(self):
+    @parameterized.expand(((0, 9), (8, 0), (-1, 0), (1, -7)))
+    def test_index_exception(self, corner_1, corner_2):
         """Raise an exception when wrong indexes are provided to add_edge()"""
         block = self.make_block(0)
 
         with self.assertRaises(ValueError):
-            block.add_edge(0, 9, Arc([1, 1, 1]))
+            block.add_edge(corner_1, corner_2, Arc([1, 1, 1]))
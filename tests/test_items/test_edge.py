@@ -2,6 +2,7 @@ import unittest
 
 import numpy as np
 
+from classy_blocks.base import transforms as tr
 from classy_blocks.base.exceptions import EdgeCreationError
 from classy_blocks.construct import edges
 from classy_blocks.construct.curves.interpolated import LinearInterpolatedCurve
@@ -11,9 +12,10 @@ from classy_blocks.items.edges.arcs.arc import ArcEdge
 from classy_blocks.items.edges.arcs.origin import OriginEdge, arc_from_origin
 from classy_blocks.items.edges.curve import OnCurveEdge, SplineEdge
 from classy_blocks.items.edges.edge import Edge
-from classy_blocks.items.edges.factory import factory
+from classy_blocks.items.edges.factory import EdgeFactory, factory
 from classy_blocks.items.edges.project import ProjectEdge
 from classy_blocks.items.vertex import Vertex
+from classy_blocks.util import constants
 from classy_blocks.util import functions as f
 
 
@@ -24,6 +26,15 @@ class EdgeTransformTests(unittest.TestCase):
         self.vertex_1 = Vertex([0, 0, 0], 0)
         self.vertex_2 = Vertex([1, 0, 0], 1)
 
+    def test_arc_edge_copy(self):
+        """Copy an edge with a cached arc point"""
+        angle_edge = AngleEdge(self.vertex_1, self.vertex_2, edges.Angle(np.pi / 2, [0, 0, 1]))
+        _ = angle_edge.third_point
+
+        copied = angle_edge.copy().translate([1, 0, 0])
+
+        np.testing.assert_array_almost_equal(copied.third_point.position - angle_edge.third_point.position, [1, 0, 0])
+
     def test_arc_edge_translate(self):
         arc_edge = ArcEdge(self.vertex_1, self.vertex_2, edges.Arc([0.5, 0, 0]))
 
@@ -72,6 +83,29 @@ class EdgeTransformTests(unittest.TestCase):
             ],
         )
 
+    def test_spline_edge_transform(self):
+        """Transform a spline edge with a list of transforms; same as one by one"""
+        points = [[0.25, 0.1, 0], [0.5, 0.5, 0], [0.75, 0.1, 0]]
+        spline_edge = SplineEdge(self.vertex_1, self.vertex_2, edges.Spline(points))
+        reference = SplineEdge(Vertex([0, 0, 0], 0), Vertex([1, 0, 0], 1), edges.Spline(points))
+
+        spline_edge.transform(
+            [tr.Translation([1, 1, 1]), tr.Rotation([0, 0, 1], np.pi / 2, [1, 0, 0]), tr.Scaling(2, [0, 0, 0])]
+        )
+        reference.translate([1, 1, 1]).rotate(np.pi / 2, [0, 0, 1], [1, 0, 0]).scale(2, [0, 0, 0])
+
+        np.testing.assert_array_almost_equal(spline_edge.point_array, reference.point_array)
+        np.testing.assert_array_almost_equal(spline_edge.vertex_2.position, reference.vertex_2.position)
+
+    def test_angle_edge_transform(self):
+        """Angle's axis is not translated by transform() either"""
+        angle_edge = AngleEdge(self.vertex_1, self.vertex_2, edges.Angle(np.pi / 2, [0, 0, 1]))
+
+        angle_edge.transform([tr.Translation([1, 1, 1])])
+
+        np.testing.assert_array_equal(angle_edge.data.axis.components, [0, 0, 1])
+        np.testing.assert_array_equal(angle_edge.vertex_1.position, [1, 1, 1])
+
     def test_default_origin(self):
         """Issue a warning when transforming with a default origin"""
         edge = ArcEdge(self.vertex_1, self.vertex_2, edges.Arc([0.5, 0.2, 0]))
@@ -135,6 +169,49 @@ class EdgeFactoryTests(unittest.TestCase):
         self.assertIsInstance(edg, SplineEdge)
         np.testing.assert_array_equal(points, edg.point_array)
 
+    def test_on_curve(self):
+        curve = LinearInterpolatedCurve([[0, 0, 0], [0.5, 0.2, 0], [1, 0, 0]])
+        edg = factory.create(self.vertex_1, self.vertex_2, edges.OnCurve(curve))
+
+        self.assertIsInstance(edg, OnCurveEdge)
+
+    def test_subclassed_data(self):
+        class CustomArc(edges.Arc):
+            pass
+
+        edg = factory.create(self.vertex_1, self.vertex_2, CustomArc([0.5, 0.2, 0]))
+
+        self.assertIsInstance(edg, ArcEdge)
+
+    def test_subclassed_data_not_registered(self):
+        class CustomArc(edges.Arc):
+            pass
+
+        factory.create(self.vertex_1, self.vertex_2, CustomArc([0.5, 0.2, 0]))
+
+        self.assertNotIn(CustomArc, factory.kinds)
+
+    def test_register_kind_name(self):
+        class CustomArcEdge(ArcEdge):
+            pass
+
+        edge_factory = EdgeFactory()
+        edge_factory.register_kind(edges.Arc, ArcEdge)
+        edge_factory.register_kind("arc", CustomArcEdge)
+
+        self.assertIs(edge_factory.get_class(edges.Arc), CustomArcEdge)
+
+    def test_register_unknown_kind_name(self):
+        with self.assertRaises(EdgeCreationError):
+            EdgeFactory().register_kind("arc", ArcEdge)
+
+    def test_unknown_data(self):
+        class CustomData(edges.EdgeData):
+            kind = "line"
+
+        with self.assertRaises(EdgeCreationError):
+            factory.create(self.vertex_1, self.vertex_2, CustomData())
+
     def test_project_edge_single(self):
         label = "terrain"
         edg = factory.create(self.vertex_1, self.vertex_2, edges.Project(label))
@@ -190,6 +267,11 @@ class EdgeValidityTests(unittest.TestCase):
         """Arc from three collinear points"""
         self.assertFalse(self.get_edge(edges.Arc([0.5, 0, 0])).is_valid)
 
+    def test_almost_collinear_arc(self):
+        """Arc points closer to a line than tolerance"""
+        self.assertFalse(self.get_edge(edges.Arc([0.5, 0.5 * constants.TOL, 0])).is_valid)
+        self.assertTrue(self.get_edge(edges.Arc([0.5, 2 * constants.TOL, 0])).is_valid)
+
     def test_invalid_origin(self):
         """Catch exceptions raised when calculating arc point from the 'origin' alternative"""
         with self.assertRaises(ValueError):
@@ -242,6 +324,33 @@ class EdgeLengthTests(unittest.TestCase):
         """Length of the 'origin' edge"""
         self.assertAlmostEqual(self.get_edge(edges.Origin([0.5, -0.5, 0])).length, 2**0.5 * np.pi / 4)
 
+    def test_arc_edge_moved(self):
+        """Cached length is recalculated after the arc has been transformed"""
+        edge = self.get_edge(edges.Arc([0.5, 0.5, 0]))
+        length = edge.length
+
+        edge.scale(2, [0, 0, 0])
+
+        self.assertAlmostEqual(edge.length, 2 * length)
+
+    def test_origin_edge_moved(self):
+        """Cached arc point is recalculated after vertices have moved"""
+        edge = self.get_edge(edges.Origin([0.5, -0.5, 0]))
+        _ = edge.length
+
+        edge.translate([1, 0, 0])
+
+        np.testing.assert_array_almost_equal(edge.third_point.position, [1.5, 2**0.5 / 2 - 0.5, 0])
+
+    def test_angle_edge_moved(self):
+        """Cached arc point is recalculated after vertices have moved"""
+        edge = self.get_edge(edges.Angle(np.pi / 2, [0, 0, -1]))
+        length = edge.length
+
+        edge.vertex_2.move_to([2, 0, 0])
+
+        self.assertAlmostEqual(edge.length, 2 * length)
+
     def test_spline_edge(self):
         """Length of the 'spline' edge - the segments, actually"""
         self.assertEqual(self.get_edge(edges.Spline([[1, 0, 0], [1, 1, 0]])).length, 3)
@@ -287,6 +396,32 @@ class AlternativeArcTests(unittest.TestCase):
             arc_from_theta(edge_point_1, edge_point_2, angle, axis), self.unit_sq_corner
         )
 
+    def test_arc_mid_multiple(self):
+        axis = np.array([[0, 0, 1], [0, 0, 1]])
+        center = np.array([[0, 0, 0], [0, 0, 1]])
+        radius = np.array([1, 2])
+        edge_point_1 = np.array([[1, 0, 0], [2, 0, 1]])
+        edge_point_2 = np.array([[0, 1, 0], [0, 2, 1]])
+
+        np.testing.assert_array_almost_equal(
+            f.arc_mid(axis, center, radius, edge_point_1, edge_point_2),
+            [self.unit_sq_corner, 2 * self.unit_sq_corner + f.vector(0, 0, 1)],
+        )
+
+    def test_arc_from_theta_multiple(self):
+        edge_point_1 = np.array([[0, 1, 0], [0, 2, 0]])
+        edge_point_2 = np.array([[1, 0, 0], [2, 0, 0]])
+        angle = np.array([np.pi / 2, np.pi / 2])
+        axis = np.array([[0, 0, -1], [0, 0, -1]])
+
+        np.testing.assert_array_almost_equal(
+            arc_from_theta(edge_point_1, edge_point_2, angle, axis), [self.unit_sq_corner, 2 * self.unit_sq_corner]
+        )
+
+    def test_arc_from_theta_invalid(self):
+        with self.assertRaises(ValueError):
+            arc_from_theta(f.vector(0, 1, 0), f.vector(1, 0, 0), 0, f.vector(0, 0, 1))
+
     def test_arc_from_origin(self):
         edge_point_1 = f.vector(0, 1, 0)
         edge_point_2 = f.vector(1, 0, 0)
@@ -15,6 +15,14 @@ class VertexTests(DataTestCase):
         with self.assertRaises(PointCreationError):
             Vertex([0, 0], 0)
 
+    def test_copy(self):
+        """A copied vertex keeps its index and doesn't share position with the original"""
+        vertex = Vertex([1, 0, 0], 5)
+        copied = vertex.copy().translate([1, 0, 0])
+
+        self.assertEqual(copied.index, 5)
+        np.testing.assert_array_equal(vertex.position, [1, 0, 0])
+
     def test_translate_int(self):
         """Vertex translation with integer delta"""
         delta = [1.0, 0.0, 0.0]
@@ -47,6 +47,15 @@ class EdgeListTests(DataTestCase):
         with self.assertRaises(EdgeNotFoundError):
             self.assertEqual(self.el.find(vertices[1], vertices[2]), edge)
 
+    def test_find_cleared(self):
+        """Raise an EdgeNotFoundError after the list has been cleared"""
+        vertices = self.get_vertices(0)
+        self.el.add(vertices[0], vertices[1], Arc([0.5, 0.5, 0]))
+        self.el.clear()
+
+        with self.assertRaises(EdgeNotFoundError):
+            self.el.find(vertices[0], vertices[1])
+
     def test_add_new(self):
         """Add an edge when no such thing exists"""
         vertices = self.get_vertices(0)
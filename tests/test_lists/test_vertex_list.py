@@ -67,6 +67,50 @@ class VertexListTests(DataTestCase):
 
             self.assertEqual(self.vlist.find_unique(point).index, i)
 
+    def test_find_many(self):
+        """Find vertices in a longer list"""
+        points = [[i, j, 0] for i in range(10) for j in range(10)]
+        self.add_all(points)
+
+        self.add_all([[i, j, 1] for i in range(10) for j in range(3)])
+
+        for i, point in enumerate(points):
+            self.assertEqual(self.vlist.find_unique(np.array(point) + constants.TOL / 10).index, i)
+
+        self.assertEqual(self.vlist.find_unique(f.vector(9, 2, 1)).index, 129)
+
+    def test_find_neighbour_cell(self):
+        """Find a vertex that is within tolerance but in a different lattice cell"""
+        self.add_all([[0.4 * constants.TOL, 0, 0]])
+
+        self.assertEqual(self.vlist.find_unique(f.vector(1.1 * constants.TOL, 0, 0)).index, 0)
+
+        with self.assertRaises(VertexNotFoundError):
+            self.vlist.find_unique(f.vector(1.5 * constants.TOL, 0, 0))
+
+    def test_positions(self):
+        """Positions array follows the list of vertices"""
+        points = [[i, j, 0] for i in range(10) for j in range(10)]
+        self.add_all(points)
+
+        np.testing.assert_array_equal(self.vlist.positions, points)
+
+    def test_find_cleared(self):
+        """Don't find vertices after the list has been cleared"""
+        self.add_all([[i, j, 0] for i in range(10) for j in range(10)])
+        self.vlist.find_unique(f.vector(0, 0, 0))
+        self.vlist.clear()
+
+        with self.assertRaises(VertexNotFoundError):
+            self.vlist.find_unique(f.vector(0, 0, 0))
+
+    def test_positions_cleared(self):
+        """No positions are left after the list has been cleared"""
+        self.add_all([[i, j, 0] for i in range(10) for j in range(10)])
+        self.vlist.clear()
+
+        self.assertEqual(len(self.vlist.positions), 0)
+
     def test_find_fail(self):
         """Raise an error when no vertex was found at specified point"""
         self.add_all(self.blocks[0].points)
@@ -78,7 +122,7 @@ class VertexListTests(DataTestCase):
         """An existing vertex at specified point and slave patch was found"""
         self.add_all(self.blocks[0].points)
         master_vertex = self.vlist.vertices[0]
-        self.vlist.duplicated = [DuplicatedEntry(master_vertex, ["terrain"])]
+        self.vlist.duplicated = {master_vertex.index: DuplicatedEntry(master_vertex, ["terrain"])}
 
         self.assertEqual(self.vlist.find_duplicated(master_vertex.position, ["terrain"]), self.vlist.vertices[0])
 
@@ -89,6 +133,18 @@ class VertexListTests(DataTestCase):
         with self.assertRaises(VertexNotFoundError):
             _ = self.vlist.find_duplicated(self.vlist.vertices[0].position, ["terrain"])
 
+    def test_find_duplicated_many(self):
+        """Find duplicated vertices in a longer list"""
+        points = [[i, j, 0] for i in range(10) for j in range(10)]
+
+        for point in points:
+            self.vlist.add(Point(point), [])
+            self.vlist.add(Point(point), ["terrain"])
+
+        self.assertEqual(len(self.vlist.vertices), 200)
+        self.assertEqual(self.vlist.find_duplicated(f.vector(9, 9, 0), ["terrain"]).index, 199)
+        self.assertEqual(self.vlist.find_duplicated(f.vector(9, 9, 0), []).index, 198)
+
     def test_add_slave_single(self):
         """Add a vertex on slave patch; must be duplicated"""
         self.add_all(self.blocks[0].points)
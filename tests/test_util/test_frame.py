@@ -9,3 +9,38 @@ class FrameTests(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             frame.add_beam(0, 0, 1)
+
+    def test_add_beam_diagonal(self):
+        frame = Frame()
+
+        with self.assertRaises(ValueError):
+            frame.add_beam(0, 2, 1)
+
+    def test_add_beam_outside(self):
+        frame = Frame()
+
+        with self.assertRaises(ValueError):
+            frame.add_beam(0, 9, 1)
+
+    def test_pair_key_unordered(self):
+        self.assertEqual(Frame.get_pair_key(1, 5), Frame.get_pair_key(5, 1))
+
+    def test_add_beam_valid(self):
+        frame = Frame()
+        frame.add_beam(1, 0, 1)
+
+        self.assertEqual(frame[0][1], 1)
+        self.assertEqual(frame[1][0], 1)
+
+    def test_empty_beams(self):
+        frame = Frame()
+
+        self.assertListEqual(frame.get_all_beams(), [])
+
+    def test_all_beams_once(self):
+        frame = Frame()
+        frame.add_beam(0, 1, "a")
+        frame.add_beam(5, 1, "b")
+        frame.add_beam(7, 4, "c")
+
+        self.assertListEqual(frame.get_all_beams(), [(0, 1, "a"), (1, 5, "b"), (4, 7, "c")])
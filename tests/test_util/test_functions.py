@@ -61,6 +61,33 @@ class TestFunctions(unittest.TestCase):
 
         self.assert_np_almost_equal(f.rotate(point, np.pi, axis, origin), f.vector(0, 1, 0))
 
+    def test_rotate_multiple_points(self):
+        """rotation of an array of points gives the same result as rotation of each point"""
+        points = np.array([[1, 0, 0], [0, 2, 0], [1, 1, 1]])
+        origin = f.vector(0, 1, 0)
+        axis = f.vector(1, 1, 0)
+
+        self.assert_np_almost_equal(
+            f.rotate(points, np.pi / 3, axis, origin), [f.rotate(p, np.pi / 3, axis, origin) for p in points]
+        )
+
+    def test_affine_rotation(self):
+        """an affine rotation matrix gives the same result as f.rotate()"""
+        point = f.vector(1, 2, 3)
+        origin = f.vector(0, 1, 0)
+        axis = f.vector(1, 1, 0)
+        matrix = f.affine_rotation(np.pi / 3, axis, origin)
+
+        self.assert_np_almost_equal(f.apply_affine(matrix, point), f.rotate(point, np.pi / 3, axis, origin))
+
+    def test_affine_composed(self):
+        """composed affine matrices give the same result as consecutive transforms"""
+        points = np.array([[1, 0, 0], [0, 2, 0], [1, 1, 1]])
+        origin = f.vector(1, 1, 0)
+        matrix = np.dot(f.affine_scaling(2, origin), f.affine_translation([1, 2, 3]))
+
+        self.assert_np_almost_equal(f.apply_affine(matrix, points), f.scale(points + f.vector(1, 2, 3), 2, origin))
+
     def test_to_polar_z_axis(self):
         """cartesian coordinate system to polar c.s., rotation around z-axis"""
         cartesian = f.vector(2, 2, 5)
@@ -123,6 +150,14 @@ class TestFunctions(unittest.TestCase):
         with self.assertRaises(ValueError):
             f.to_cartesian(p, axis="a")
 
+    def test_polyline_length(self):
+        points = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [1, 1, 2]]
+
+        self.assertAlmostEqual(f.polyline_length(points), 4)
+
+    def test_polyline_length_single(self):
+        self.assertEqual(f.polyline_length([[1, 1, 1]]), 0)
+
     def test_arc_length_3point_half(self):
         a = f.vector(0, 0, 0)
         b = f.vector(1, 1, 0)